@@ -41,6 +41,7 @@ class GravityInversion(EspressoProblem):
         so that you can access them in the other functions see the following as an 
         example (suggested) usage of `self.params`
         """
+        self._jacobian = None
         setup_params = _setup(example_number)
         if setup_params:
             _to_expand = [
@@ -78,12 +79,7 @@ class GravityInversion(EspressoProblem):
     
     @property
     def data(self):
-        m = self.m
-        x_nodes = self.x_nodes
-        y_nodes = self.y_nodes
-        z_nodes = self.z_nodes
-        rec_coords = self.rec_coords
-        gz_rec = _calculate_gravity(m, x_nodes, y_nodes, z_nodes, rec_coords)
+        gz_rec = self.forward(self.m)
         datan=gz_rec+np.random.normal(0,0.005*np.max(np.abs(gz_rec)),len(gz_rec))
         return datan
 
@@ -93,22 +89,24 @@ class GravityInversion(EspressoProblem):
         return np.zeros([self.data_size,self.data_size])
 
     def forward(self, model, with_jacobian=False):
-        x_nodes = self.x_nodes
-        y_nodes = self.y_nodes
-        z_nodes = self.z_nodes
-        rec_coords = self.rec_coords
-        res = _calculate_gravity(
-            model, x_nodes, y_nodes, z_nodes, rec_coords, with_jacobian
-        )
-        return res
+        Jz_rec = self.jacobian(model)
+        # Result is multiplied by 1e5 to convert from m/s^2 to mGal
+        gz_rec = 1e5 * G * (Jz_rec @ model)
+        if with_jacobian:
+            return gz_rec, Jz_rec
+        else:
+            return gz_rec
     
     def jacobian(self, model):
-        x_nodes = self.x_nodes
-        y_nodes = self.y_nodes
-        z_nodes = self.z_nodes
-        rec_coords = self.rec_coords
-        res = _calculate_gravity(model, x_nodes, y_nodes, z_nodes, rec_coords, True)
-        return res[1]
+        # gz is linear in density, so the kernel only depends on the geometry and
+        # is computed once, then shared by forward, jacobian and data
+        if self._jacobian is None:
+            x_nodes = self.x_nodes
+            y_nodes = self.y_nodes
+            z_nodes = self.z_nodes
+            rec_coords = self.rec_coords
+            self._jacobian = _gravity_kernel(x_nodes, y_nodes, z_nodes, rec_coords)
+        return self._jacobian
 
     def plot_model(self, model):
         rec_coords = self.rec_coords
@@ -333,16 +331,12 @@ def _kernel(ii, jj, kk, dx, dy, dz, dim):
         g = -gxx - gyy
     return g
 
-def _calculate_gravity(model, x_nodes, y_nodes, z_nodes, rec_coords, with_jacobian=False):
+def _gravity_kernel(x_nodes, y_nodes, z_nodes, rec_coords):
     # Tolerance implementation follows Nagy et al., 2000
         tol = 1e-4
-        # gx_rec=np.zeros(len(rec_coords))
-        # gy_rec=np.zeros(len(rec_coords))
-        gz_rec = np.zeros(len(rec_coords))
-        if with_jacobian:
-            # Jx_rec=np.zeros([len(rec_coords),len(x_nodes)])
-            # Jy_rec=np.zeros([len(rec_coords),len(x_nodes)])
-            Jz_rec = np.zeros([len(rec_coords), len(x_nodes)])
+        # Jx_rec=np.zeros([len(rec_coords),len(x_nodes)])
+        # Jy_rec=np.zeros([len(rec_coords),len(x_nodes)])
+        Jz_rec = np.zeros([len(rec_coords), len(x_nodes)])
         for recno in range(len(rec_coords)):
             dx = x_nodes - rec_coords[recno, 0]
             dy = y_nodes - rec_coords[recno, 1]
@@ -362,21 +356,10 @@ def _calculate_gravity(model, x_nodes, y_nodes, z_nodes, rec_coords, with_jacobi
                         # Jx+=_kernel(ii,jj,kk,dx,dy,dz,"gx")
                         # Jy+=_kernel(ii,jj,kk,dx,dy,dz,"gy")
                         Jz += _kernel(ii, jj, kk, dx, dy, dz, "gz")
-            # Multiply J (Nx1) with the model density (Nx1) element-wise
-
-            # Result is multiplied by 1e5 to convert from m/s^2 to mGal
-            # gx_rec[recno] = 1e5*G*sum(model*Jx)
-            # gy_rec[recno] = 1e5*G*sum(model*Jy)
-            gz_rec[recno] = 1e5 * G * sum(model * Jz)
-            if with_jacobian:
-                # Jx_rec[recno,:] = Jx
-                # Jy_rec[recno,:] = Jy
-                Jz_rec[recno, :] = Jz
-
-        if with_jacobian:
-            return gz_rec, Jz_rec
-        else:
-            return gz_rec
+            # Jx_rec[recno,:] = Jx
+            # Jy_rec[recno,:] = Jy
+            Jz_rec[recno, :] = Jz
+        return Jz_rec
 
 def _setup(num):
     # tmp = pkgutil.get_data(__name__, "data/gravmodel1.txt")
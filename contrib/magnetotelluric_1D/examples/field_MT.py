@@ -36,13 +36,16 @@ smoothing_factor = 50
 reg_smoothing = smoothing_factor * cofi.utils.QuadraticReg("smoothing", (mt.model_size,))
 reg = reg_smoothing
 
-def objective_func(model, reg):
+# the data covariance is fixed during the inversion, so build its inverse once
+Cd_inv = mt.inverse_covariance_matrix
+
+def objective_func(model, reg, Cd_inv):
     dpred = mt.forward(model)
-    data_misfit = mt.misfit(mt.data,dpred,mt.inverse_covariance_matrix)
+    data_misfit = mt.misfit(mt.data,dpred,Cd_inv)
     model_reg = reg(model)
     return  data_misfit + model_reg
 
-mt_problem.set_objective(objective_func, args=[reg])
+mt_problem.set_objective(objective_func, args=[reg, Cd_inv])
 
 
 ## 2. Define the inversion options
@@ -215,12 +215,16 @@ def forward_1D_MT(model, depths, freqs, return_G = False, return_Z = False):
     #       by Brown University. Surv Geophys 8, 187–231 (1986).
 
     # adapted from https://empymod.emsig.xyz/en/stable/gallery/fdomain/magnetotelluric.html
+
+    # model can also be a stack of models of shape (..., nLayers), in which case
+    # the responses of all of them are computed at once with shape (..., nData),
+    # and the Jacobians (if return_G) with shape (..., nData, nLayers)
     
     w = 2*np.pi*freqs # angular frequencies
     model_lin = 10**model # electrical resistivities in linear scale
 
     # Calculate impedance Z at the top of the bottom half space 
-    Z = np.sqrt(1j * w * mu_0 * model_lin[-1])
+    Z = np.sqrt(1j * w * mu_0 * model_lin[...,-1,None])
     
     # The surface impedance Z is found recursively from the bottom propagating upwards
     for j in range(len(depths)-1,-1,-1):
@@ -228,11 +232,11 @@ def forward_1D_MT(model, depths, freqs, return_G = False, return_Z = False):
         if j == 0: th = depths[j]
         else: th = depths[j] - depths[j-1]
         # calculate intrinsic impedance zo of layer j
-        zo = np.sqrt(1j * w * mu_0 * model_lin[j])
+        zo = np.sqrt(1j * w * mu_0 * model_lin[...,j,None])
         # calculate reflection coefficient R of layer j
         R = (zo - Z) / (zo + Z)
         # calculate induction parameter gamma of layer j
-        gamma = np.sqrt(1j * w * mu_0 / model_lin[j])
+        gamma = np.sqrt(1j * w * mu_0 / model_lin[...,j,None])
         # update impedance Z at the top of layer j
         Z = zo * (1 - R * np.exp(-2*gamma*th)) / (1 + R * np.exp(-2*gamma*th))
         
@@ -242,9 +246,7 @@ def forward_1D_MT(model, depths, freqs, return_G = False, return_Z = False):
     
     if return_G:
         # Jacobian calculation using finite differences 
-        M = len(model)
-        N = len(data)
-        G = np.zeros((N, M))
+        M = model.shape[-1]
         
         # ppert = 0.01 # Perturbation (percentage)
         # for i in range(M):
@@ -253,10 +255,10 @@ def forward_1D_MT(model, depths, freqs, return_G = False, return_Z = False):
         #     G[:,i] = (dpert - data) / (model * ppert)[i]
 
         apert = 0.01 # Perturbation (absolute)
-        for i in range(M):
-            model_pert = model + apert * np.identity(M)[:,i]
-            dpert = forward_1D_MT(model_pert,depths, freqs)
-            G[:,i] = (dpert - data) / apert
+        # models_pert[...,i,:] perturbs parameter i, all of them are run in one batch
+        models_pert = model[...,None,:] + apert * np.identity(M)
+        dpert = forward_1D_MT(models_pert, depths, freqs)
+        G = np.swapaxes(dpert - data[...,None,:], -1, -2) / apert
 
     if return_Z:
         return Z
@@ -277,12 +279,12 @@ def z2rhophy(freqs,Z,dZ=None):
     
     # calculate errors of apparent resistivity and phases
     if dZ is None:
-        return np.r_[np.log10(rho_app), phase], np.r_[np.zeros(Z.shape[0]*2)]
+        return np.concatenate((np.log10(rho_app), phase), axis=-1), np.zeros(Z.shape[:-1]+(Z.shape[-1]*2,))
     else:
         drho_app = 2*rho_app*dZ / abs(Z)
         dphase = np.degrees(0.5 * (drho_app/rho_app))
         log10_drho_app = (1/np.log(10)) * (drho_app/rho_app)
-        return np.r_[np.log10(rho_app), phase], np.r_[log10_drho_app, dphase]
+        return np.concatenate((np.log10(rho_app), phase), axis=-1), np.concatenate((log10_drho_app, dphase), axis=-1)
 
 
 
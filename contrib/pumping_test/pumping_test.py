@@ -69,6 +69,8 @@ class PumpingTest(EspressoProblem):
         #    self._sigma = 0.1
         else:
             raise InvalidExampleError
+        # inverse data variances, kept as a vector rather than a dense diagonal matrix
+        self._data_weights = np.full(self.data_size, 1./self._sigma**2.)
 
     @property
     def description(self):
@@ -96,11 +98,11 @@ class PumpingTest(EspressoProblem):
 
     @property
     def covariance_matrix(self):
-        return self._sigma**2.*np.eye(self.data_size)
+        return np.diag(1./self._data_weights)
 
     @property
     def inverse_covariance_matrix(self):
-        return 1./self._sigma**2.*np.eye(self.data_size)
+        return np.diag(self._data_weights)
         
     def forward(self, model, with_jacobian=False):
         if with_jacobian:
@@ -176,8 +178,11 @@ class PumpingTest(EspressoProblem):
         raise NotImplementedError
 
     def log_likelihood(self, data1, data2): 
+        # data2 may also be a stack of predictions (one per row), in which case
+        # an array of log likelihoods is returned, e.g. for vectorized samplers
         residual = data1 - data2
-        return (-0.5*residual@self.inverse_covariance_matrix@residual.T).item()
+        log_like = -0.5*np.einsum("...i,i,...i->...", residual, self._data_weights, residual)
+        return log_like.item() if np.ndim(log_like) == 0 else log_like
     
     def log_prior(self, model):
         raise NotImplementedError
@@ -1,4 +1,5 @@
 import pathlib
+import functools
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -63,10 +64,11 @@ class ReceiverFunctionInversion(EspressoProblem):
 
         self._t, self._data = self.rf.rfcalc(self._ref_model_setup, sn=0.2)
 
-        # compute covariance matrix
-        self._Cdinv = self.rf.InvDataCov(2.5,0.01,len(self._data))
+        # compute covariance matrix (shared between instances, copied so it's safe to modify)
+        Cdinv, Cd = _data_covariances(self.rf, len(self._data))
+        self._Cdinv = Cdinv.copy()
         # self._Cdinv /= 100        # (potentially we can) temper the likelihood by rescaling the data covariance
-        self._Cd = np.linalg.inv(self._Cdinv)
+        self._Cd = Cd.copy()
 
         # example-specific model setup
         if example_number == 1:
@@ -189,28 +191,32 @@ class ReceiverFunctionInversion(EspressoProblem):
         return logLike.item()
 
     def log_prior(self, model):
+        model = np.asarray(model)
         if self.example_number == 1:
             depths_increasing = model[0] < model[1]
             depths_in_range = model[0] >= 3.5 and model[1] <= 40
             if depths_increasing and depths_in_range: 
                 return np.log(1/(40-3.5)).item()
         elif self.example_number == 2:
-            veloc_in_3_7 = all([m_p < 7. and m_p > 3. for m_p in model])
+            veloc_in_3_7 = model.min() > 3. and model.max() < 7.
             if veloc_in_3_7: return np.log(1/2).item()
-        elif self.example_number == 3:
-            depths_in_0_60 = all([m_p < 60 and m_p > 0 for m_p in model[[0,2,4,6,8]]])
-            veloc_in_3_7 = all([m_p < 7. and m_p > 3. for m_p in model[[1,3,5,7,9]]])
-            params_increasing = all([model[i] < model[i+2] for i in range(0,len(model)-2,2)])
-            if depths_in_0_60 and veloc_in_3_7 and params_increasing:
-                return np.log(1/60).item()
-        elif self.example_number == 4:
-            depths_in_0_60 = all([m_p < 60 and m_p > 0 for m_p in model[[0,2,4]]])
-            veloc_in_3_7 = all([m_p < 7. and m_p > 3. for m_p in model[[1,3,5]]])
-            params_increasing = all([model[i] < model[i+2] for i in range(0,len(model)-2,2)])
-            if depths_in_0_60 and veloc_in_3_7 and params_increasing:
+        elif self.example_number == 3 or self.example_number == 4:
+            depths, veloc = model[0::2], model[1::2]
+            # chained so that a model is rejected at the first failed test
+            if depths.min() > 0 and depths.max() < 60 \
+                    and veloc.min() > 3. and veloc.max() < 7. \
+                    and np.all(depths[:-1] < depths[1:]):
                 return np.log(1/60).item()
         return float("-inf")
 
 
+@functools.lru_cache(maxsize=None)
+def _data_covariances(rf, ndata):
+    # the data covariance only depends on the number of data points, so the SVD
+    # and inversion are done once rather than for every example instance
+    Cdinv = rf.InvDataCov(2.5,0.01,ndata)
+    return Cdinv, np.linalg.inv(Cdinv)
+
+
 # 37 EARTH SCIENCES -> 3706	Geophysics -> 370609 Seismology and seismic exploration -> Receiver function -> ReceiverFunctionInversion
 # description: 'Receiver functions' are a class of seismic data used to study discontinuities (layering) in the Earth's crust.
@@ -33,29 +33,23 @@ def rfcalc(model,sn=0.0,mtype=0,fs=25.0,gauss_a=2.5,water_c=0.0001,angle=35.0,ti
 def InvDataCov(width,Ar,ndata): # Calculate Data covariance matrix for evaluation of waveform fit
     sigsq = width**2
     Arsq = Ar*Ar # waveform noise variance    
-    Cd = np.zeros((ndata,ndata))
-    for k1 in range(ndata):
-        for k2 in range(ndata):
-            Cd[k1][k2] = np.exp(-0.5*(k1-k2)**2/sigsq)
+    k = np.arange(ndata)
+    Cd = np.exp(-0.5*np.subtract.outer(k,k)**2/sigsq)
     U, s, V = np.linalg.svd(Cd)
-    pmax = [ n for n,a in enumerate(s) if a<0.000001 ][0]
-    Sinv = np.diag(1.0/s[:pmax])
-    Cdinv = np.dot(V.T[:,:pmax], np.dot(Sinv, U.T[:pmax,:]))
+    pmax = np.flatnonzero(s<0.000001)[0]
+    Cdinv = np.dot(V.T[:,:pmax]/s[:pmax], U.T[:pmax,:]) # V S^-1 U^T without forming S^-1
     return Cdinv/Arsq
 
 ##################################################################################
 def InvDataCovSub(width,Ar,ndata,ind): # Calculate Data sub-covariance matrix for evaluation of waveform fit
     sigsq = width**2
     Arsq = Ar*Ar # waveform noise variance    
-    Cd = np.zeros((ndata,ndata))
-    for k1 in range(ndata):
-        for k2 in range(ndata):
-            Cd[k1][k2] = np.exp(-0.5*(k1-k2)**2/sigsq)
+    k = np.arange(ndata)
+    Cd = np.exp(-0.5*np.subtract.outer(k,k)**2/sigsq)
     Cdused = Cd[ind,:][:,ind]
     U, s, V = np.linalg.svd(Cdused)
-    pmax = [ n for n,a in enumerate(s) if a>0.000001 ][-1]+1
-    Sinv = np.diag(1.0/s[:pmax])
-    Cdinv = np.dot(V.T[:,:pmax], np.dot(Sinv, U.T[:pmax,:]))
+    pmax = np.flatnonzero(s>0.000001)[-1]+1
+    Cdinv = np.dot(V.T[:,:pmax]/s[:pmax], U.T[:pmax,:]) # V S^-1 U^T without forming S^-1
     return Cdinv/Arsq        
 ##################################################################################
 def plot_misfit_profile(x,misfit,xtrue,iparam): # Plot calculated and observed RF waveform 
@@ -5,6 +5,7 @@ from espresso.exceptions import InvalidExampleError
 from espresso.utils import loadtxt, absolute_path
 from PIL import Image
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import tqdm
 
 
@@ -28,6 +29,8 @@ class XrayTomography(EspressoProblem):
 
     def __init__(self, example_number=1):
         super().__init__(example_number)
+        self._jacobian = None
+        self._jacobian_ngrid = None
         if example_number == 1:
             self._paths, self._attns = load_data('data/example1.dat')
             self._desc = "A straightforward X-ray tracer setup with good data coverage (InLab logo)"
@@ -82,9 +85,8 @@ class XrayTomography(EspressoProblem):
         raise NotImplementedError               # optional
         
     def forward(self, model, with_jacobian=False):
-        n = model.size
-        ngrid = int(n**0.5)
-        attns,A = tracer(model.reshape((ngrid,ngrid)),self._paths)
+        A = self.jacobian(model)
+        attns = A @ model.flatten()
         if with_jacobian:
             return attns, A
         else:
@@ -93,8 +95,12 @@ class XrayTomography(EspressoProblem):
     def jacobian(self, model):
         n = model.size
         ngrid = int(n**0.5)
-        attns,A = tracer(model.reshape((ngrid,ngrid)),self._paths)
-        return A
+        # Paths are straight lines, so the Jacobian depends only on the grid size.
+        # Trace it once and reuse it until a model on a different grid comes in.
+        if self._jacobian_ngrid != ngrid:
+            _,self._jacobian = tracer(np.ones((ngrid,ngrid)),self._paths)
+            self._jacobian_ngrid = ngrid
+        return self._jacobian
 
     def plot_model(self, model, paths=False, **kwargs):
         m = model.reshape((self._ngrid,self._ngrid))
@@ -105,8 +111,9 @@ class XrayTomography(EspressoProblem):
         # ax.set_yticks([])
         plt.colorbar(im,ax=ax,label='Density')
         if paths:
-            for p in self._paths:
-                ax.plot([p[0],p[2]],[p[1],p[3]],'y',linewidth=0.05)
+            # a single collection instead of one Line2D artist per path
+            segments = self._paths[:,:4].reshape((-1,2,2))
+            ax.add_collection(LineCollection(segments,colors='y',linewidths=0.05))
         return ax
     
     def plot_data(self, data1, data2=None):
@@ -185,7 +192,7 @@ def tracer(model,paths,extent=(0,1,0,1)):
             iy = ny-1
         else:
             iy = np.searchsorted(yGridBounds,ys,side='right' if yr>ys else 'left')-1
-        pathSensitivity = np.zeros_like(model)
+        pathSensitivity = A[ip].reshape((nx,ny)) # view, written straight into A
         ilam0=2 if lam[lamSort[1]]==0 else 1
         for ilam in range(ilam0,len(lam)):
             dl = (lam[lamSort[ilam]] - lam[lamSort[ilam-1]])*pathLength
@@ -197,7 +204,6 @@ def tracer(model,paths,extent=(0,1,0,1)):
                 ix+=dx
             if lam[lamSort[ilam]]==1.:break
 
-        A[ip,:] = pathSensitivity.flatten()
         t.update(1)
     t.close()
 
@@ -213,7 +219,7 @@ def load_data(filename):
     attns = -np.log(data[:,5]/data[:,2])
     return paths, attns
 
-def generateExampleDataset(img_filename, out_filename):
+def generateExampleDataset(img_filename, out_filename, seed=None):
     noiseLevels=None #[0.005,0.01,0.015,0.02,0.025]
     noiseLevels=[0.0001]
     # m = pngToModel(img_filename,1024,1024,1,1)
@@ -225,15 +231,15 @@ def generateExampleDataset(img_filename, out_filename):
     recs = generateSurfacePoints(30,surface=[True,True,True,True])
     srcs = generateSurfacePoints(20,surface=[True,True,True,True])
     paths = buildPaths(srcs,recs)
-    Isrc = np.random.uniform(10,1,size=paths.shape[0])
+    rng = np.random.default_rng(seed) # pass a seed to reproduce the synthetic dataset
+    Isrc = rng.uniform(1,10,size=paths.shape[0])
     attns,A = tracer(m,paths)
     Irec = Isrc*np.exp(-attns)
     if noiseLevels is not None:
-        noise = np.zeros([paths.shape[0]])
-        for i in range(0,paths.shape[0]):
-            noise[i] = np.random.choice(noiseLevels)
-            Irec[i]+=np.random.normal(0,noise[i])
-            if Irec[i]<=0: Irec[i] = 1.e-3
+        # noise levels are drawn with replacement: each path gets one of the levels
+        noise = rng.choice(noiseLevels,size=paths.shape[0])
+        Irec += rng.normal(0,noise)
+        Irec[Irec<=0] = 1.e-3
 
     fp = open(out_filename,'w')
     fp.write("# Src-x Src-y Src-Int Rec-x Rec-y Rec-Int")
@@ -9,6 +9,7 @@ import argparse
 import warnings
 import pathlib
 import typing
+import matplotlib
 
 
 # ------------------------------- constants -------------------------------------------
@@ -137,6 +138,13 @@ def suppress_stdout():
             tqdm.tqdm = tqdm_copy
 
 
+# figures produced when running examples are only checked for their type, so they are
+# never rendered to a GUI; MPLBACKEND also reaches pytest / xdist subprocesses
+def use_non_interactive_backend():
+    os.environ["MPLBACKEND"] = "Agg"
+    matplotlib.use("Agg")
+
+
 # ------------------------------- contribution processing -----------------------------
 def problem_name_to_class(problem_name):  # e.g. "xray_tracer" -> "XrayTomography"
     return problem_name.title().replace("_", "")
@@ -287,6 +287,7 @@ def post_validate():
 
 
 def main():
+    _utils.use_non_interactive_backend()
     _args = _utils.args()
     if _args.pre:
         pre_validate()
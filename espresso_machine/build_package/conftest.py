@@ -25,4 +25,5 @@ def pytest_generate_tests(metafunc):
     if "contrib" in metafunc.fixturenames:
         specified = metafunc.config.getoption("contribs")
         problems = _utils.problems_to_run(specified)
-        metafunc.parametrize("contrib", set(problems))
+        # sorted, so that every pytest-xdist worker collects the same test order
+        metafunc.parametrize("contrib", sorted(set(problems)))
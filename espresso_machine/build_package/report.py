@@ -5,8 +5,10 @@ Usage:
 - To generate report, compliance_report(problems_to_check=None, pre_build=True)
 - To print report, print_compliance_report(report)
 """
+import os
 import dataclasses
 import typing
+import multiprocessing
 
 import run_examples
 import criteria
@@ -32,9 +34,30 @@ class ProblemRawReport:
             self.attributes_additional = list()
             self._collect_attributes_report(results)
 
+    @classmethod
+    def from_error(cls, problem_name, problem_class_name, error):
+        """Report for a problem whose run failed before any report was collected"""
+        report = cls.__new__(cls)
+        report.problem_name = problem_name
+        report.problem_class_name = problem_class_name
+        report.metadata = error
+        return report
+
     def metadata_ok(self) -> bool:
         return self.metadata == True
 
+    def replace_contrib_errors(self):
+        """Replace exceptions of non-builtin types with ``ContributionError``
+
+        Exception classes defined in a contribution can't be unpickled outside of
+        the worker process that imported the contribution.
+        """
+        self.metadata = _as_builtin_error(self.metadata)
+        if self.metadata_ok():
+            for sub_report in (self.attributes_required, self.attributes_optional):
+                for attr_name, attr_res in sub_report.items():
+                    sub_report[attr_name] = [_as_builtin_error(r) for r in attr_res]
+
     def _collect_metadata_report(self, results: run_examples.ResultsFromProblem):
         if isinstance(results.parent_module, Exception):
             return results.parent_module
@@ -100,6 +123,28 @@ class ProblemRawReport:
         self.attributes_additional = _additional_attr
 
 
+class ContributionError(Exception):
+    """Stand-in for an exception raised from a contribution, keeping its type name
+    and message"""
+
+    def __init__(self, type_name, message):
+        super().__init__(type_name, message)
+        self.type_name = type_name
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"{self.type_name}({self.message!r})"
+
+
+def _as_builtin_error(obj):
+    if isinstance(obj, Exception) and type(obj).__module__ != "builtins":
+        return ContributionError(type(obj).__name__, str(obj))
+    return obj
+
+
 def raw_compliance_report(problems_to_check=None, pre_build=True, timeout=None) \
     -> dict[str, ProblemRawReport]:
     """Run all problems and generate a raw compliance report
@@ -119,15 +164,54 @@ def raw_compliance_report(problems_to_check=None, pre_build=True, timeout=None)
             }
         }
     }
+
+    Problems are independent of each other, so when more than one is checked they are
+    run in parallel, one problem per worker process. Reports coming back from the
+    workers have exceptions of non-builtin types replaced by ``ContributionError``
+    so that they can be pickled, and a problem that fails to run is reported with
+    the error as its metadata instead of aborting the whole report. A single problem
+    is run in this process and keeps the original exceptions.
     """
-    raw_report = dict()
     problems = _utils.problems_to_run(problems_to_check)
-    results = run_examples.run_problems(problems, pre_build=pre_build, timeout=timeout)
-    for res in results:
-        raw_report[res.problem_class_str] = ProblemRawReport(res)
+    tasks = [(problem, pre_build, timeout) for problem in problems]
+    if len(tasks) > 1:
+        # workers are started from a fresh server process rather than forked from this
+        # one, which may already be running threads (e.g. tqdm's monitor)
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            ctx = multiprocessing.get_context("forkserver")
+        else:
+            ctx = multiprocessing.get_context("spawn")
+        nprocs = min(len(tasks), os.cpu_count() or 1)
+        with ctx.Pool(nprocs, initializer=_utils.use_non_interactive_backend) as pool:
+            reports = pool.starmap(_raw_report_in_worker, tasks)
+    else:
+        reports = [_raw_report_for_problem(*task) for task in tasks]
+    raw_report = dict()
+    for report in reports:
+        raw_report.update(report)
     return raw_report
 
 
+def _raw_report_for_problem(problem, pre_build, timeout):
+    results = run_examples.run_problems([problem], pre_build=pre_build, timeout=timeout)
+    return [(res.problem_class_str, ProblemRawReport(res)) for res in results]
+
+
+def _raw_report_in_worker(problem, pre_build, timeout):
+    # workers don't inherit the caller's stdout / tqdm patching, so apply it here
+    with _utils.suppress_stdout():
+        try:
+            reports = _raw_report_for_problem(problem, pre_build, timeout)
+        except Exception as e:
+            prob_name = problem[0]
+            prob_class_str = _utils.problem_name_to_class(prob_name)
+            error_report = ProblemRawReport.from_error(prob_name, prob_class_str, e)
+            reports = [(prob_class_str, error_report)]
+    for _, report in reports:
+        report.replace_contrib_errors()
+    return reports
+
+
 @dataclasses.dataclass
 class ProblemReport:
     problem_name: str
@@ -12,6 +12,7 @@ python validate.py [-h] [--all] [--pre] [--post] [--contrib CONTRIBS] [--file <f
 import sys
 import subprocess
 import pathlib
+import importlib.util
 import pytest
 
 import _utils
@@ -26,16 +27,30 @@ def prep_params(pre_build=None):
         for contrib in specified_contribs:
             extra_args.append("--contribution")
             extra_args.append(contrib)
+    # contributions are validated independently, so spread them over all CPU cores
+    # when pytest-xdist is available
+    if len(specified_contribs) > 1 and importlib.util.find_spec("xdist") is not None:
+        extra_args.extend(["-n", "auto"])
     return pre, dir_parent, extra_args
 
 
+def run_pytest(pre, pytest_args):
+    # Pre-build checks run in this interpreter to save a Python startup. Post-build
+    # checks need a fresh interpreter so that the newly installed espresso package
+    # is imported instead of the one already cached in sys.modules.
+    if pre:
+        return pytest.main(pytest_args)
+    pytest_cmd = [sys.executable, "-m", "pytest"] + pytest_args
+    return subprocess.run(pytest_cmd).returncode
+
+
 def test_all_examples(pre, dir_parent, extra_args):
     py_test_examples = dir_parent / "test_examples.py"
-    pytest_cmd = [sys.executable, "-m", "pytest", str(py_test_examples)]
-    pytest_cmd.extend(extra_args)
+    pytest_args = [str(py_test_examples)]
+    pytest_args.extend(extra_args)
     if not pre:
-        pytest_cmd.append("--post")
-    exit_status_test_examples = subprocess.run(pytest_cmd).returncode
+        pytest_args.append("--post")
+    exit_status_test_examples = run_pytest(pre, pytest_args)
     if exit_status_test_examples != pytest.ExitCode.OK:
         sys.exit(exit_status_test_examples)
 
@@ -43,15 +58,16 @@ def test_all_examples(pre, dir_parent, extra_args):
 def test_requirements(pre, dir_parent, extra_args):
     if not pre:
         py_check_requires = dir_parent / "check_requires.py"
-        pytest_cmd = [sys.executable, "-m", "pytest", str(py_check_requires)]
-        pytest_cmd.extend(extra_args)
-        exit_status_check_requires = subprocess.run(pytest_cmd).returncode
+        pytest_args = [str(py_check_requires)]
+        pytest_args.extend(extra_args)
+        exit_status_check_requires = run_pytest(pre, pytest_args)
         if exit_status_check_requires != pytest.ExitCode.OK:
             sys.exit(exit_status_check_requires)
 
 
 # --> main test
 def main(pre_build=None):
+    _utils.use_non_interactive_backend()
     pre, dir_parent, extra_args = prep_params(pre_build)
     test_all_examples(pre, dir_parent, extra_args)
     test_requirements(pre, dir_parent, extra_args)